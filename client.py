@@ -1,92 +1,201 @@
 # encoding: utf-8
 """
 This file contains the modified client simulator code.
-- Generates more realistic methanol plant simulation data.
+- Generates more realistic methanol plant simulation data (--mode realistic).
+- Simulates a fleet of simple sensors over concurrent connections (--mode simple).
 - Reads server configuration from config.ini.
 """
 
+import argparse
+import asyncio
+import heapq
+import os
+import select
 import socket
 import time
-import json
 import random
+import re
 import configparser
+import functools
 import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
 import colorlog
+import numpy as np
+import orjson
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Built once; get_client_logger only attaches it
+_COLOR_FORMATTER = colorlog.ColoredFormatter(
+    '%(log_color)s[CLIENT] %(levelname)s: %(message)s',
+    log_colors={'DEBUG': 'cyan', 'INFO': 'green', 'WARNING': 'yellow', 'ERROR': 'red', 'CRITICAL': 'red,bg_white'}
+)
 
 def get_client_logger(level=logging.INFO):
     """Configures the client logger."""
-    logger = logging.getLogger("server")
+    logger = logging.getLogger("client")
     if logger.hasHandlers():
         logger.handlers.clear()
     logger.setLevel(level)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    color_formatter = colorlog.ColoredFormatter(
-        '%(log_color)s[CLIENT] %(levelname)s: %(message)s',
-        log_colors={'DEBUG': 'cyan', 'INFO': 'green', 'WARNING': 'yellow', 'ERROR': 'red', 'CRITICAL': 'red,bg_white'}
-    )
-    console_handler.setFormatter(color_formatter)
+    console_handler.setFormatter(_COLOR_FORMATTER)
     logger.addHandler(console_handler)
     logger.propagate = False
     return logger
 
 client_logger = get_client_logger()
 
-def generate_random_data() -> dict:
-    """Generates a set of simulated data for a methanol production scenario."""
-    
-    # Define normal operating ranges for parameters
-    POWER_NORMAL, POWER_RANGE = 30, 20
-    OEE_NORMAL, OEE_RANGE = 0.92, 0.06
-    REACTOR_TEMP_NORMAL, REACTOR_TEMP_RANGE = 250.0, 5.0
-    REACTOR_PRESSURE_NORMAL, REACTOR_PRESSURE_RANGE = 5.0, 0.5
-    
-    # 1. Energy Consumption
-    realtime_power = round(random.uniform(POWER_NORMAL - POWER_RANGE, POWER_NORMAL + POWER_RANGE), 2)
-    operating_rate = round(random.uniform(0.8, 1.0), 2)
-    
-    # 2. Operational Status
-    oee = round(random.uniform(OEE_NORMAL - OEE_RANGE, OEE_NORMAL + OEE_RANGE), 3)
-    
-    # 3. Main Workshop
+CONFIG_PATH = 'config.ini'
+
+
+@dataclass(frozen=True, slots=True)
+class ClientConfig:
+    """Client settings read from config.ini."""
+    host: str
+    port: int
+    min_interval: float
+    max_interval: float
+    retry_base_delay: float
+    retry_max_delay: float
+    # Simple mode only
+    device_ids: Tuple[str, ...]
+    concurrent_devices: int
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(path: str, mtime: float) -> ClientConfig:
+    """Parses the client settings once per config file revision."""
+    config = configparser.ConfigParser()
+    config.read(path)
+    return ClientConfig(
+        host=config.get('server', 'host', fallback='localhost'),
+        port=config.getint('server', 'port', fallback=9000),
+        min_interval=config.getfloat('client_simulator', 'min_send_interval', fallback=5),
+        max_interval=config.getfloat('client_simulator', 'max_send_interval', fallback=10),
+        retry_base_delay=config.getfloat('client_simulator', 'retry_base_delay', fallback=0.5),
+        retry_max_delay=config.getfloat('client_simulator', 'retry_max_delay', fallback=60.0),
+        device_ids=tuple(config.get('client_simulator', 'device_ids', fallback='temp-sensor-01').split(',')),
+        concurrent_devices=config.getint('client_simulator', 'concurrent_devices', fallback=5),
+    )
+
+
+def load_config(path: str = CONFIG_PATH) -> ClientConfig:
+    """Returns the cached client settings, re-parsing only if the file changed."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = 0.0
+    return _load_config(path, mtime)
+
+# Define normal operating ranges for parameters
+POWER_NORMAL, POWER_RANGE = 30, 20
+OEE_NORMAL, OEE_RANGE = 0.92, 0.06
+REACTOR_TEMP_NORMAL, REACTOR_TEMP_RANGE = 250.0, 5.0
+REACTOR_PRESSURE_NORMAL, REACTOR_PRESSURE_RANGE = 5.0, 0.5
+
+# (low, high, decimals) of every random draw, in the order _sample_readings unpacks them
+_SAMPLE_RANGES = (
+    (POWER_NORMAL - POWER_RANGE, POWER_NORMAL + POWER_RANGE, 2),  # realtime_power
+    (0.8, 1.0, 2),  # operating_rate
+    (OEE_NORMAL - OEE_RANGE, OEE_NORMAL + OEE_RANGE, 3),  # oee
+    (0.2, 0.95, 2),  # storage_tank_level_percentage
+    (0.3, 0.8, 2),  # condenser_level_percentage
+    (0.7, 0.9, 2),  # reactor_level_percentage
+    (REACTOR_PRESSURE_NORMAL - REACTOR_PRESSURE_RANGE, REACTOR_PRESSURE_NORMAL + REACTOR_PRESSURE_RANGE, 2),  # reactor_pressure
+    (REACTOR_TEMP_NORMAL - REACTOR_TEMP_RANGE, REACTOR_TEMP_NORMAL + REACTOR_TEMP_RANGE, 2),  # reactor_temp
+    (1200, 1600, 0),  # unit_energy_consumption
+    (60.0, 80.0, 2),  # water_tank_temperature
+    (60.0, 80.0, 2),  # boiler_temperature
+    (0.1 - 0.02, 0.1 + 0.02, 3),  # storage_pressure
+    (25.0 - 5.0, 25.0 + 5.0, 2),  # storage_temperature
+    (90.0 - 2.0, 90.0 + 2.0, 2),  # hot_side_in_temp
+    (45.0 - 2.0, 45.0 + 2.0, 2),  # hot_side_out_temp
+    (15.0 - 2.0, 15.0 + 2.0, 2),  # cold_side_in_temp
+    (25.0 - 2.0, 25.0 + 2.0, 2),  # cold_side_out_temp
+    (0.9 * 100, 0.95 * 100, 3),  # co_conversion_rate, in %
+    ((0.90 - 0.05) * 100, 0.90 * 100, 3),  # h2_utilization_rate, in %
+)
+_LOW = np.array([r[0] for r in _SAMPLE_RANGES], dtype=float)
+_HIGH = np.array([r[1] for r in _SAMPLE_RANGES], dtype=float)
+_SCALE = 10.0 ** np.array([r[2] for r in _SAMPLE_RANGES])
+_RNG = np.random.default_rng()
+
+def _sample_readings() -> dict:
+    """Draws one set of simulated readings, keyed by the field they fill in the message."""
+    # One vectorized draw for every random value, rounded to each field's precision
+    (realtime_power, operating_rate, oee,
+     storage_tank_level_percentage, condenser_level_percentage, reactor_level_percentage,
+     reactor_pressure, reactor_temp, unit_energy_consumption,
+     water_tank_temperature, boiler_temperature, storage_pressure, storage_temperature,
+     hot_side_in_temp, hot_side_out_temp, cold_side_in_temp, cold_side_out_temp,
+     co_conversion_rate, h2_utilization_rate) = (np.round(_RNG.uniform(_LOW, _HIGH) * _SCALE) / _SCALE).tolist()
+
     storage_tank_total_height = 25
-    storage_tank_level_percentage = round(random.uniform(0.2, 0.95), 2)
     storage_tank_level_height = storage_tank_total_height * storage_tank_level_percentage
     condenser_tank_total_height = 25
-    condenser_level_percentage = round(random.uniform(0.3, 0.8), 2)
     condenser_level_height = condenser_tank_total_height * condenser_level_percentage
     reactor_total_height = 20
-    reactor_level_percentage = round(random.uniform(0.7, 0.9), 2)
     reactor_level_height = reactor_level_percentage * reactor_total_height
-    reactor_pressure = round(random.uniform(REACTOR_PRESSURE_NORMAL - REACTOR_PRESSURE_RANGE, REACTOR_PRESSURE_NORMAL + REACTOR_PRESSURE_RANGE), 2)
-    reactor_temp = round(random.uniform(REACTOR_TEMP_NORMAL - REACTOR_TEMP_RANGE, REACTOR_TEMP_NORMAL + REACTOR_TEMP_RANGE), 2)
 
-    # Assemble into JSON format
-    data = {
-        # Timestamp and device ID are fundamental
+    return {
         "timestamp": time.time(),
+        "realtime_power": f"{realtime_power:.2f}MW",
+        "today_energy": f"{realtime_power * 8:.2f}MWh", # Assuming 8 hours of operation
+        "unit_energy_consumption": f"{unit_energy_consumption:.0f}kgce/t", # kg of coal equivalent per ton of methanol
+        "operating_rate": f"{operating_rate * 100:.1f}%",
+        "oee": f"{oee * 100:.1f}%",
+        "water_tank_temperature": f"{water_tank_temperature:.2f}\xB0C",
+        "boiler_temperature": f"{boiler_temperature:.2f}\xB0C",
+        "storage_level_height": f"{storage_tank_level_height:.2f}m",
+        "storage_level_percentage": f"{storage_tank_level_percentage * 100:.1f}%",
+        "storage_pressure": f"{storage_pressure:.3f}MPa",
+        "storage_temperature": f"{storage_temperature:.2f}\xB0C",
+        "condenser_level_height": f"{condenser_level_height:.2f}m",
+        "condenser_level_percentage": f"{condenser_level_percentage * 100:.1f}%",
+        "hot_side_in_temp": f"{hot_side_in_temp:.2f}\xB0C",
+        "hot_side_out_temp": f"{hot_side_out_temp:.2f}\xB0C",
+        "cold_side_in_temp": f"{cold_side_in_temp:.2f}\xB0C",
+        "cold_side_out_temp": f"{cold_side_out_temp:.2f}\xB0C",
+        "reactor_level_height": f"{reactor_level_height:.2f}m",
+        "reactor_level_percentage": f"{reactor_level_percentage * 100:.1f}%",
+        "reactor_pressure": f"{reactor_pressure:.2f}MPa",
+        "reactor_temperature": f"{reactor_temp:.2f}\xB0C",
+        "co_conversion_rate": f"{co_conversion_rate:.3f}%",
+        "h2_utilization_rate": f"{h2_utilization_rate:.3f}%",
+    }
+
+def _build_payload(r) -> dict:
+    """Lays the readings out in the message structure expected by the server."""
+    return {
+        # Timestamp and device ID are fundamental
+        "timestamp": r["timestamp"],
         "device_id": "methanol_plant_main",
 
         # Park-level data (to be stored in separate columns)
         "energy_consumption": {
-            "realtime_power": str(realtime_power) + 'MW',
-            "today_energy": str(round(realtime_power * 8, 2)) + 'MWh', # Assuming 8 hours of operation
-            "unit_energy_consumption": str(round(random.uniform(1200, 1600), 0)) + 'kgce/t' # kg of coal equivalent per ton of methanol
+            "realtime_power": r["realtime_power"],
+            "today_energy": r["today_energy"],
+            "unit_energy_consumption": r["unit_energy_consumption"]
         },
         "operational_status": {
-            "operating_rate": str(round(operating_rate * 100, 1)) + '%',
-            "oee": str(round(oee * 100, 1)) + '%'
+            "operating_rate": r["operating_rate"],
+            "oee": r["oee"]
         },
-        
+
         # Detailed equipment-level data (to be stored in a JSONB column)
         "equipment_status": {
             "water_tank": {
-                "temperature": str(round(random.uniform(60.0, 80.0), 2)) + "\xB0C",
+                "temperature": r["water_tank_temperature"],
                 "temperature_threshold": "90.0\xB0C"
             },
             "boiler": {
-                "temperature": str(round(random.uniform(60.0, 80.0), 2)) + "\xB0C",
+                "temperature": r["boiler_temperature"],
                 "temperature_threshold": "90.0\xB0C"
             }
         },
@@ -94,74 +203,419 @@ def generate_random_data() -> dict:
             "storage_area": {
                 0:{
                     "tank_model": "T-101A",
-                    "level_height": str(storage_tank_level_height) + 'm',
-                    "level_percentage": str(round(storage_tank_level_percentage * 100, 1)) + '%',
-                    "pressure": str(round(random.uniform(0.1 - 0.02, 0.1 + 0.02), 3)) + 'MPa',
-                    "temperature": str(round(random.uniform(25.0 - 5.0, 25.0 + 5.0), 2)) + "\xB0C"
+                    "level_height": r["storage_level_height"],
+                    "level_percentage": r["storage_level_percentage"],
+                    "pressure": r["storage_pressure"],
+                    "temperature": r["storage_temperature"]
                  }
             },
             "condensation_area": {
                 0:{
                     "condenser_id": "C-201",
-                    "level_height": str(condenser_level_height) + 'm',
-                    "level_percentage": str(round(condenser_level_percentage * 100, 1)) + '%',
-                    "hot_side_in_temp": str(round(random.uniform(90.0 - 2.0, 90.0 + 2.0), 2)) + '\xB0C',
-                    "hot_side_out_temp": str(round(random.uniform(45.0 - 2.0, 45.0 + 2.0), 2)) + '\xB0C',
-                    "cold_side_in_temp": str(round(random.uniform(15.0 - 2.0, 15.0 + 2.0), 2)) + '\xB0C',
-                    "cold_side_out_temp": str(round(random.uniform(25.0 - 2.0, 25.0 + 2.0), 2)) + '\xB0C',
+                    "level_height": r["condenser_level_height"],
+                    "level_percentage": r["condenser_level_percentage"],
+                    "hot_side_in_temp": r["hot_side_in_temp"],
+                    "hot_side_out_temp": r["hot_side_out_temp"],
+                    "cold_side_in_temp": r["cold_side_in_temp"],
+                    "cold_side_out_temp": r["cold_side_out_temp"],
                 }
             },
             "reaction_area": {
                 0:{
                     "reactor_model": "R-301",
-                    "level_height": str(reactor_level_height) + 'm',
-                    "level_percentage": str(round(reactor_level_percentage * 100, 1)) + '%',
-                    "pressure": str(reactor_pressure) + 'MPa',
-                    "temperature": str(reactor_temp) + '\xB0C',
-                    "co_conversion_rate": str(round(random.uniform(0.9, 0.95) * 100, 3)) + '%',
-                    "h2_utilization_rate": str(round(random.uniform(0.90 - 0.05, 0.90) * 100, 3)) + '%'
+                    "level_height": r["reactor_level_height"],
+                    "level_percentage": r["reactor_level_percentage"],
+                    "pressure": r["reactor_pressure"],
+                    "temperature": r["reactor_temperature"],
+                    "co_conversion_rate": r["co_conversion_rate"],
+                    "h2_utilization_rate": r["h2_utilization_rate"]
                 }
             }
         }
     }
-    return data
 
-def run_client():
-    """Main client function to connect to the server and send data in a loop."""
-    config = configparser.ConfigParser()
-    config.read('config.ini')
-    
-    host = config.get('server', 'host', fallback='localhost')
-    port = config.getint('server', 'port', fallback=9000)
+class _Placeholders(dict):
+    """Stands in for the readings while the message template is built."""
+    def __missing__(self, key):
+        return f"@@{key}@@"
+
+# Readings that are JSON numbers rather than strings
+_NUMERIC_READINGS = frozenset({"timestamp"})
+
+def _build_message_template() -> str:
+    """Serializes the static skeleton once, leaving %-style slots for the readings."""
+    skeleton = orjson.dumps(_build_payload(_Placeholders()), option=orjson.OPT_NON_STR_KEYS)
+    template = skeleton.decode('utf-8').replace('%', '%%')
+
+    def slot(match):
+        name = match.group(1)
+        return f"%({name})r" if name in _NUMERIC_READINGS else f'"%({name})s"'
+
+    return re.sub(r'"@@(\w+)@@"', slot, template)
+
+_MESSAGE_TEMPLATE = _build_message_template()
+
+def render_message(readings: dict) -> bytes:
+    """
+    Fills the pre-serialized template with one set of readings.
+
+    String readings are spliced in verbatim, so they must not contain
+    characters that need JSON escaping (quotes, backslashes, control chars).
+    """
+    return (_MESSAGE_TEMPLATE % readings).encode('utf-8')
+
+# --- Simple mode: sensor fleet ---
+
+def _gen_temp() -> dict:
+    # Temperature in Celsius
+    return {"temperature": str(round(random.uniform(15.0, 35.0), 2)) + "\xB0C"}
+
+def _gen_pressure() -> dict:
+    # Pressure in kPa
+    return {"pressure": str(round(random.uniform(100.0, 105.0), 2)) + "kPa"}
+
+def _gen_humidity() -> dict:
+    # Humidity in %
+    return {"humidity": str(round(random.uniform(30.0, 60.0), 2)) + "%"}
+
+def _gen_vibration() -> dict:
+    # Vibration in g
+    return {
+        "vibration_x": str(round(random.uniform(0.01, 0.5), 4)) + "g",
+        "vibration_y": str(round(random.uniform(0.01, 0.5), 4)) + "g",
+        "vibration_z": str(round(random.uniform(0.05, 1.5), 4)) + "g",
+    }
+
+def _gen_power() -> dict:
+    # Power consumption in kW
+    voltage = round(random.uniform(215.0, 225.0), 1)
+    current = round(random.uniform(1.0, 15.0), 2)
+    # Calculate power = voltage * current / 1000 (to convert W to kW),
+    # on the numbers, before they are formatted with their units
+    power = round(voltage * current / 1000, 3)
+    return {"voltage": f"{voltage}V", "current": f"{current}A", "power": f"{power}kW"}
+
+def _gen_generic() -> dict:
+    return {"value": round(random.uniform(0, 100), 2)}
+
+# Checked in order against the device id; the first matching substring wins
+_SENSOR_KINDS = (
+    ("temp", _gen_temp),
+    ("pressure", _gen_pressure),
+    ("humidity", _gen_humidity),
+    ("vibration", _gen_vibration),
+    ("power", _gen_power),
+)
+
+# device_id -> metrics generator, filled by register_devices()
+_DISPATCH: Dict[str, Callable[[], dict]] = {}
+
+def _generator_for(device_id: str) -> Callable[[], dict]:
+    for keyword, generator in _SENSOR_KINDS:
+        if keyword in device_id:
+            return generator
+    return _gen_generic
+
+def register_devices(device_ids) -> None:
+    """Resolve the metrics generator of each device once, up front."""
+    for device_id in device_ids:
+        _DISPATCH[device_id] = _generator_for(device_id)
+
+# (whole second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_ts_prefix_cache = (None, "")
 
-    min_interval = config.getint('client_simulator', 'min_send_interval', fallback=5)
-    max_interval = config.getint('client_simulator', 'max_send_interval', fallback=10)
-    
-    client_logger.info(f"Attempting to connect to {host}:{port}")
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601, e.g. 2023-01-01T00:00:00.123456Z.
 
+    The seconds part is only re-formatted when the second changes; devices
+    sending within the same second just append their microseconds.
+    """
+    global _ts_prefix_cache
+    sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _ts_prefix_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_prefix_cache = (sec, prefix)
+    return f"{prefix}.{usec:06d}Z"
+
+def generate_sensor_data(device_id: str) -> dict:
+    """Generates a plausible sensor data payload."""
+    generator = _DISPATCH.get(device_id)
+    if generator is None:
+        generator = _DISPATCH[device_id] = _generator_for(device_id)
+    return {
+        "device_id": device_id,
+        # Send timestamp in ISO 8601 format, as handled by the server
+        "ts": _utc_timestamp(),
+        "status": "ok",
+        "metrics": generator(),
+    }
+
+def generate_random_data(profile: str = 'methanol', device_id: str = 'temp-sensor-01') -> dict:
+    """
+    Generates one simulated message.
+
+    'methanol' is the plant-wide methanol production message; 'sensor' is a
+    single reading of the sensor named by device_id.
+    """
+    if profile == 'methanol':
+        return _build_payload(_sample_readings())
+    if profile == 'sensor':
+        return generate_sensor_data(device_id)
+    raise ValueError(f"Unknown profile: {profile!r}")
+
+# Socket send buffer size, and how often coalesced messages are flushed when
+# sampling faster than 1 Hz (seconds)
+SEND_BUFFER_SIZE = 1 << 20
+FLUSH_INTERVAL = 0.1
+
+# TCP keepalive: probe after 30 s idle, every 10 s, drop the peer after 3 misses
+KEEPALIVE_OPTIONS = (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+
+def _configure_socket(s: socket.socket):
+    """Applies the latency, buffering and dead-peer detection options to a connected socket."""
+    # Send each message immediately instead of waiting on Nagle's algorithm
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in KEEPALIVE_OPTIONS:
+        # Not every platform exposes the per-socket keepalive timers
+        if hasattr(socket, name):
+            s.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+
+# Message delimiter, sent as its own buffer next to the payload
+NEWLINE = b'\n'
+# Most buffers a single sendmsg accepts (IOV_MAX on Linux)
+_IOV_MAX = 1024
+
+def _send_all(s: socket.socket, chunks):
+    """
+    Writes the chunks back to back, gathering them into as few syscalls as
+    possible with sendmsg (plain send of the joined bytes where the platform
+    has no sendmsg, i.e. Windows).
+
+    A full send buffer (BlockingIOError) is transient: wait until the socket is
+    writable and carry on from where the kernel stopped. Errors that mean the
+    peer is gone propagate to the reconnect loop.
+    """
+    gather = hasattr(s, 'sendmsg')
+    if not gather:
+        chunks = (b''.join(chunks),)
+    views = [memoryview(c) for c in chunks if c]
+    i = 0
+    while i < len(views):
+        try:
+            sent = s.sendmsg(views[i:i + _IOV_MAX]) if gather else s.send(views[i])
+        except BlockingIOError:
+            select.select([], [s], [])
+            continue
+        # Drop the fully sent buffers and trim the partially sent one
+        while sent:
+            size = views[i].nbytes
+            if sent >= size:
+                sent -= size
+                i += 1
+            else:
+                views[i] = views[i][sent:]
+                sent = 0
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * 2 ** min(attempt, 32)))
+
+def run_client(config: Optional[ClientConfig] = None):
+    """
+    Main client function to connect to the server and send data in a loop.
+
+    Without an explicit config, config.ini is consulted again on every
+    reconnect, so edits take effect without restarting the client.
+    """
+    cfg = config or load_config()
+    client_logger.info("Attempting to connect to %s:%d", cfg.host, cfg.port)
+
+    # Consecutive failed connections, reset once a connection succeeds
+    attempt = 0
     while True:
+        # Cheap on reconnect: only re-parsed when config.ini has been edited
+        cfg = config or load_config()
+        host, port = cfg.host, cfg.port
+        min_interval, max_interval = cfg.min_interval, cfg.max_interval
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.connect((host, port))
-                client_logger.info(f"Connected to server at {host}:{port}")
+                _configure_socket(s)
+                client_logger.info("Connected to server at %s:%d", host, port)
+                attempt = 0
+
+                # Above 1 Hz, messages are buffered and written in one go every FLUSH_INTERVAL
+                coalesce = max_interval < 1.0
+                pending = []
+                pending_bytes = 0
+                last_flush = time.monotonic()
                 while True:
-                    data = generate_random_data()
-                    message = json.dumps(data, ensure_ascii=False) + '\n'
-                    
-                    s.sendall(message.encode('utf-8'))
-                    client_logger.info(f"Sent data: {json.dumps(data, indent=2)}")
-                    
-                    time.sleep(random.uniform(min_interval, max_interval)) # Send data every 5 seconds
-        
+                    readings = _sample_readings()
+                    payload = render_message(readings)
+
+                    if coalesce:
+                        pending += (payload, NEWLINE)
+                        pending_bytes += len(payload) + 1
+                        now = time.monotonic()
+                        if now - last_flush >= FLUSH_INTERVAL:
+                            _send_all(s, pending)
+                            client_logger.info("Sent %d bytes", pending_bytes)
+                            pending.clear()
+                            pending_bytes = 0
+                            last_flush = now
+                    else:
+                        _send_all(s, (payload, NEWLINE))
+                        client_logger.info("Sent %d bytes", len(payload) + 1)
+                    if client_logger.isEnabledFor(logging.DEBUG):
+                        # The workshop areas are keyed by int, hence OPT_NON_STR_KEYS
+                        data = _build_payload(readings)
+                        pretty = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+                        client_logger.debug("Sent data: %s", pretty.decode('utf-8'))
+
+                    time.sleep(random.uniform(min_interval, max_interval))
+
         except ConnectionRefusedError:
-            client_logger.error("Connection refused. Is the server running? Retrying in 10 seconds...")
-            time.sleep(10)
-        except (BrokenPipeError, ConnectionResetError):
-            client_logger.warning("Connection lost. Attempting to reconnect in 10 seconds...")
-            time.sleep(10)
+            delay = backoff_delay(attempt, cfg.retry_base_delay, cfg.retry_max_delay)
+            attempt += 1
+            client_logger.error("Connection refused. Is the server running? Retrying in %.1f seconds...", delay)
+            time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            # TimeoutError: the keepalive probes went unanswered
+            delay = backoff_delay(attempt, cfg.retry_base_delay, cfg.retry_max_delay)
+            attempt += 1
+            client_logger.warning("Connection lost. Attempting to reconnect in %.1f seconds...", delay)
+            time.sleep(delay)
         except Exception as e:
-            client_logger.critical(f"An unexpected error occurred: {e}")
+            client_logger.critical("An unexpected error occurred: %s", e)
             break
 
+# --- Simple mode: concurrent sensor simulator ---
+
+# Deadlines this close together are served by the same scheduler wakeup (seconds)
+SCHEDULER_WINDOW = 0.05
+# A device whose connection still holds this much unsent data skips its turn (bytes)
+MAX_UNSENT_BYTES = 64 * 1024
+
+async def run_device_simulator(device_id: str, cfg: ClientConfig, writers: Dict[str, asyncio.StreamWriter]):
+    """
+    A coroutine that keeps a single device connected.
+
+    The device's writer is published in ``writers`` while the connection is up;
+    the messages themselves are sent by run_scheduler.
+    """
+    client_logger.info("[%s] Starting simulation.", device_id)
+
+    # Consecutive failed connections, reset once a connection succeeds
+    attempt = 0
+    while True:
+        try:
+            client_logger.info("[%s] Attempting to connect to %s:%s...", device_id, cfg.host, cfg.port)
+            reader, writer = await asyncio.open_connection(cfg.host, cfg.port)
+            client_logger.info("[%s] Connection successful.", device_id)
+            attempt = 0
+            _configure_socket(writer.get_extra_info("socket"))
+            writers[device_id] = writer
+            try:
+                # The server never replies, so this only returns once the connection is gone
+                await reader.read()
+            finally:
+                del writers[device_id]
+                writer.close()
+            raise ConnectionResetError("connection closed by server")
+
+        except (ConnectionRefusedError, ConnectionResetError, OSError) as e:
+            delay = backoff_delay(attempt, cfg.retry_base_delay, cfg.retry_max_delay)
+            attempt += 1
+            client_logger.warning("[%s] Connection error: %s. Retrying in %.1f seconds...", device_id, e, delay)
+            await asyncio.sleep(delay)
+        except Exception as e:
+            delay = backoff_delay(attempt, cfg.retry_base_delay, cfg.retry_max_delay)
+            attempt += 1
+            client_logger.error("[%s] An unexpected error occurred: %s. Retrying in %.1f seconds...", device_id, e, delay)
+            await asyncio.sleep(delay)
+
+async def run_scheduler(device_ids, cfg: ClientConfig, writers: Dict[str, asyncio.StreamWriter]):
+    """
+    Sends every device's messages from a single timer.
+
+    Keeps a heap of (next_send_time, device_id) and sleeps until the earliest
+    deadline, then serves all deadlines within SCHEDULER_WINDOW in one wakeup.
+    The scheduler never waits on a socket: devices that are currently
+    disconnected, or whose connection has fallen MAX_UNSENT_BYTES behind,
+    simply skip their turn, so one stalled peer cannot hold up the others.
+    """
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    # Spread the first messages over the shortest send interval
+    heap = [(now + random.uniform(0, cfg.min_interval), device_id) for device_id in device_ids]
+    heapq.heapify(heap)
+
+    while True:
+        delay = heap[0][0] - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        now = loop.time()
+        horizon = now + SCHEDULER_WINDOW
+        due = []
+        while heap and heap[0][0] <= horizon:
+            due.append(heapq.heappop(heap)[1])
+
+        for device_id in due:
+            writer = writers.get(device_id)
+            if writer is not None and not writer.is_closing():
+                if writer.transport.get_write_buffer_size() >= MAX_UNSENT_BYTES:
+                    client_logger.warning("[%s] Connection backed up, skipping this message", device_id)
+                else:
+                    # Serialize straight to UTF-8 bytes; the newline goes out as a
+                    # separate buffer of the same write instead of a concatenated copy
+                    payload = orjson.dumps(generate_sensor_data(device_id))
+                    writer.writelines((payload, b"\n"))
+                    client_logger.info("[%s] Sent %d bytes", device_id, len(payload) + 1)
+            # Wait for a random interval
+            heapq.heappush(heap, (now + random.uniform(cfg.min_interval, cfg.max_interval), device_id))
+
+async def run_simulator(config: Optional[ClientConfig] = None):
+    """Simple mode: launches all device simulators."""
+    cfg = config or load_config()
+    client_logger.info("--- Starting IoT Device Simulator ---")
+    if cfg.concurrent_devices > len(cfg.device_ids):
+        client_logger.warning("concurrent_devices is greater than the number of device_ids.")
+    device_ids = cfg.device_ids[:cfg.concurrent_devices]
+    if not device_ids:
+        return
+    register_devices(device_ids)
+
+    # device_id -> writer of its live connection
+    writers: Dict[str, asyncio.StreamWriter] = {}
+    # One task per device keeps it connected, a single scheduler sends for all of them
+    tasks = [asyncio.create_task(run_device_simulator(device_id, cfg, writers)) for device_id in device_ids]
+    tasks.append(asyncio.create_task(run_scheduler(device_ids, cfg, writers)))
+
+    # Wait for all tasks to complete (they run forever, so this will wait until cancelled)
+    await asyncio.gather(*tasks)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sends simulated plant data to the TCP server.")
+    parser.add_argument(
+        '--mode', choices=('realistic', 'simple'), default='realistic',
+        help="realistic: one connection sending methanol plant data (default); "
+             "simple: one connection per configured sensor device",
+    )
+    args = parser.parse_args()
+
+    if args.mode == 'realistic':
+        run_client()
+        return
+    try:
+        # uvloop (libuv) where available, e.g. not on Windows; the stdlib loop otherwise
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            runner.run(run_simulator())
+    except KeyboardInterrupt:
+        client_logger.info("--- Simulator stopped by user. ---")
+
 if __name__ == '__main__':
-    run_client()
+    main()
@@ -0,0 +1,29 @@
+import orjson
+import pytest
+
+import client
+
+
+def expected(readings) -> bytes:
+    return orjson.dumps(client._build_payload(readings), option=orjson.OPT_NON_STR_KEYS)
+
+
+@pytest.mark.parametrize("attempt", range(50))
+def test_render_message_matches_orjson(attempt):
+    readings = client._sample_readings()
+    assert client.render_message(readings) == expected(readings)
+
+
+def test_render_message_whole_second_timestamp():
+    readings = client._sample_readings()
+    readings["timestamp"] = 1700000000.0
+    assert client.render_message(readings) == expected(readings)
+
+
+def test_render_message_has_no_trailing_newline():
+    assert not client.render_message(client._sample_readings()).endswith(b"\n")
+
+
+def test_generate_random_data_rejects_unknown_profile():
+    with pytest.raises(ValueError):
+        client.generate_random_data(profile="nope")
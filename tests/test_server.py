@@ -0,0 +1,300 @@
+import asyncio
+import contextlib
+import importlib.util
+import json
+import os
+from datetime import datetime, timezone
+
+import asyncpg
+import orjson
+import pytest
+
+import client
+import server
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_spec = importlib.util.spec_from_file_location("legacy_server", os.path.join(ROOT, "legacy", "server.py"))
+legacy_server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(legacy_server)
+
+ENERGY = {"realtime_power": "50.00MW", "today_energy": "800.0MWh", "unit_energy_consumption": "1.20"}
+OPERATIONS = {"operating_rate": "95.0%", "oee": "88.0%"}
+
+
+def plant_message(**overrides) -> bytes:
+    msg = {
+        "timestamp": 1700000000.5,
+        "device_id": "methanol_plant_main",
+        "energy_consumption": dict(ENERGY),
+        "operational_status": dict(OPERATIONS),
+        "equipment_status": {"boiler": {"temperature": "80.0°C"}},
+        "main_workshop": {"storage_area": {"0": {"tank_model": "T-101A"}}},
+    }
+    msg.update(overrides)
+    return orjson.dumps(msg)
+
+
+@pytest.fixture(params=["msgspec", "dict"])
+def decoder(request, monkeypatch):
+    """Runs a test against both the msgspec schema and the orjson/json fallback."""
+    if request.param == "msgspec":
+        if server._plant_decoder is None:
+            pytest.skip("msgspec not installed")
+    else:
+        monkeypatch.setattr(server, "_plant_decoder", None)
+    return request.param
+
+
+def test_parse_plant_message_builds_row(decoder):
+    row = server.parse_plant_message(plant_message())
+    assert len(row) == len(server.PLANT_LOG_COLUMNS)
+    assert row[0] == datetime.fromtimestamp(1700000000.5, timezone.utc)
+    assert row[1:6] == ("50.00MW", "800.0MWh", "1.20", "95.0%", "88.0%")
+    assert orjson.loads(row[6]) == {
+        "equipment_status": {"boiler": {"temperature": "80.0°C"}},
+        "main_workshop": {"storage_area": {"0": {"tank_model": "T-101A"}}},
+    }
+
+
+def test_parse_plant_message_accepts_crlf_ending(decoder):
+    row = server.parse_plant_message(plant_message() + b"\r\n")
+    assert row is not None
+    assert row[1] == "50.00MW"
+
+
+def test_parse_plant_message_accepts_client_output(decoder):
+    line = client.render_message(client._sample_readings()) + b"\n"
+    row = server.parse_plant_message(line)
+    assert row is not None
+    assert all(isinstance(value, str) for value in row[1:6])
+
+
+def test_parse_plant_message_without_timestamp_uses_now(decoder):
+    before = datetime.now(timezone.utc)
+    row = server.parse_plant_message(plant_message(timestamp=None))
+    assert row[0].tzinfo is not None
+    assert row[0] >= before
+
+
+@pytest.mark.parametrize("overrides", [
+    {"energy_consumption": None, "operational_status": None},
+    {"energy_consumption": {k: v for k, v in ENERGY.items() if k != "today_energy"}},
+    {"operational_status": {"operating_rate": "95.0%"}},
+])
+def test_parse_plant_message_rejects_missing_fields(decoder, overrides):
+    msg = orjson.loads(plant_message(**overrides))
+    msg = {k: v for k, v in msg.items() if v is not None}
+    assert server.parse_plant_message(orjson.dumps(msg)) is None
+
+
+@pytest.mark.parametrize("overrides", [{"timestamp": 0}, {"timestamp": None, "ts": 0}])
+def test_parse_plant_message_keeps_epoch_zero(decoder, overrides):
+    row = server.parse_plant_message(plant_message(**overrides))
+    assert row[0] == datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("overrides", [
+    {"timestamp": True},
+    {"timestamp": [1]},
+    {"timestamp": {"seconds": 1}},
+    {"ts": False},
+])
+def test_parse_plant_message_rejects_non_numeric_timestamp(decoder, overrides):
+    assert server.parse_plant_message(plant_message(**overrides)) is None
+
+
+@pytest.mark.parametrize("timestamp", [1e20, -1e20])
+def test_parse_plant_message_out_of_range_timestamp_uses_now(decoder, timestamp):
+    before = datetime.now(timezone.utc)
+    row = server.parse_plant_message(plant_message(timestamp=timestamp))
+    assert row[0] >= before
+
+
+def test_parse_plant_message_nan_timestamp_uses_now(monkeypatch):
+    # Only the stdlib json fallback accepts NaN; orjson and msgspec reject the line
+    monkeypatch.setattr(server, "_plant_decoder", None)
+    monkeypatch.setattr(server, "_json_loads", json.loads)
+    before = datetime.now(timezone.utc)
+    row = server.parse_plant_message(plant_message(timestamp=0).replace(b'"timestamp":0', b'"timestamp":NaN'))
+    assert row[0] >= before
+
+
+def test_parse_plant_message_rejects_bare_timestamp(decoder):
+    assert server.parse_plant_message(b'{"timestamp": 1700000000, "device_id": "d"}') is None
+
+
+@pytest.mark.parametrize("overrides", [
+    {"energy_consumption": dict(ENERGY, realtime_power=50.0)},
+    {"operational_status": dict(OPERATIONS, oee=None)},
+    {"operational_status": "running"},
+])
+def test_parse_plant_message_rejects_wrong_types(decoder, overrides):
+    assert server.parse_plant_message(plant_message(**overrides)) is None
+
+
+@pytest.mark.parametrize("line", [b"[1, 2]", b'"text"', b"42", b"{not json", b"   \r\n"])
+def test_parse_plant_message_rejects_non_objects(decoder, line):
+    assert server.parse_plant_message(line) is None
+
+
+def test_parse_message_line_returns_received_bytes():
+    line = b'{"device_id": "temp-1", "ts": "2023-01-01T00:00:00.5Z", "metrics": {}}\r\n'
+    device_id, ts, payload = legacy_server.parse_message_line(line)
+    assert device_id == "temp-1"
+    assert ts == datetime(2023, 1, 1, 0, 0, 0, 500000, tzinfo=timezone.utc)
+    assert payload == line.strip()
+
+
+@pytest.mark.parametrize("device_id", [5, [1], {"id": "x"}, True])
+def test_parse_message_line_rejects_non_str_device_id(device_id):
+    with pytest.raises(ValueError):
+        legacy_server.parse_message_line(orjson.dumps({"device_id": device_id}))
+
+
+@pytest.mark.parametrize("line", [b"[1]", b"", b"{oops"])
+def test_parse_message_line_rejects_invalid_lines(line):
+    with pytest.raises(ValueError):
+        legacy_server.parse_message_line(line)
+
+
+class FakePool:
+    """Stands in for an asyncpg pool; every acquire() hands out a new connection.
+
+    bulk_errors and row_errors are consumed one per COPY/executemany and per
+    single-row insert; None or an exhausted list means the call succeeds.
+    """
+
+    def __init__(self, bulk_errors=(), row_errors=()):
+        self.bulk_errors = list(bulk_errors)
+        self.row_errors = list(row_errors)
+        self.written = []
+        self.acquired = 0
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        yield FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def _next(self, errors):
+        error = errors.pop(0) if errors else None
+        if error is not None:
+            raise error
+
+    async def copy_records_to_table(self, table, records, columns):
+        self._next(self.pool.bulk_errors)
+        self.pool.written.extend(records)
+
+    async def executemany(self, sql, rows):
+        self._next(self.pool.bulk_errors)
+        self.pool.written.extend(rows)
+
+    async def execute(self, sql, *row):
+        self._next(self.pool.row_errors)
+        self.pool.written.append(row)
+
+
+def sample_rows(count: int) -> list[tuple]:
+    return [(f"row-{i}", "50.00MW") for i in range(count)]
+
+
+@pytest.fixture
+def plant_server(monkeypatch):
+    monkeypatch.setattr(server, "WRITE_RETRY_DELAY", 0)
+    return server.TcpToDbServer()
+
+
+def test_write_rows_copies_the_batch(plant_server):
+    plant_server.db_pool = pool = FakePool()
+    rows = sample_rows(3)
+    asyncio.run(plant_server._write_rows(rows))
+    assert pool.written == rows
+    assert pool.acquired == 1
+
+
+def test_write_rows_falls_back_to_row_by_row_when_copy_is_rejected(plant_server):
+    plant_server.db_pool = pool = FakePool(
+        bulk_errors=[asyncpg.NotNullViolationError("null value")],
+        row_errors=[None, asyncpg.NotNullViolationError("null value"), None],
+    )
+    rows = sample_rows(3)
+    asyncio.run(plant_server._write_rows(rows))
+    assert pool.written == [rows[0], rows[2]]
+    assert pool.acquired == 1
+
+
+def test_write_rows_resumes_row_by_row_on_a_fresh_connection(plant_server):
+    plant_server.db_pool = pool = FakePool(
+        bulk_errors=[TypeError("expected str")],
+        row_errors=[None, asyncpg.ConnectionDoesNotExistError("connection lost")],
+    )
+    rows = sample_rows(3)
+    asyncio.run(plant_server._write_rows(rows))
+    # row-0 is not written twice, and the failed row-1 is retried
+    assert pool.written == rows
+    assert pool.acquired == 2
+
+
+def test_write_rows_retries_the_copy_after_a_connection_error(plant_server):
+    plant_server.db_pool = pool = FakePool(bulk_errors=[OSError("connection reset")])
+    rows = sample_rows(3)
+    asyncio.run(plant_server._write_rows(rows))
+    assert pool.written == rows
+    assert pool.acquired == 2
+
+
+def test_write_rows_drops_the_batch_after_write_attempts(plant_server):
+    plant_server.db_pool = pool = FakePool(
+        bulk_errors=[asyncpg.ConnectionDoesNotExistError("connection lost")] * server.WRITE_ATTEMPTS
+    )
+    asyncio.run(plant_server._write_rows(sample_rows(3)))
+    assert pool.written == []
+    assert pool.acquired == server.WRITE_ATTEMPTS
+
+
+@pytest.fixture
+def sensor_server(monkeypatch):
+    monkeypatch.setattr(legacy_server, "WRITE_RETRY_DELAY", 0)
+    return legacy_server.TcpToDbServer()
+
+
+def test_insert_rows_falls_back_to_row_by_row_when_the_batch_is_rejected(sensor_server):
+    sensor_server.db_pool = pool = FakePool(
+        bulk_errors=[asyncpg.UntranslatableCharacterError("unsupported Unicode escape sequence")],
+        row_errors=[asyncpg.UntranslatableCharacterError("unsupported Unicode escape sequence"), None, None],
+    )
+    rows = sample_rows(3)
+    asyncio.run(sensor_server._insert_rows(rows))
+    assert pool.written == rows[1:]
+    assert pool.acquired == 1
+
+
+def test_insert_rows_resumes_row_by_row_on_a_fresh_connection(sensor_server):
+    sensor_server.db_pool = pool = FakePool(
+        bulk_errors=[asyncpg.DataError("invalid input syntax for type json")],
+        row_errors=[None, None, asyncpg.InterfaceError("connection is closed")],
+    )
+    rows = sample_rows(3)
+    asyncio.run(sensor_server._insert_rows(rows))
+    assert pool.written == rows
+    assert pool.acquired == 2
+
+
+def test_insert_rows_retries_the_batch_after_a_connection_error(sensor_server):
+    sensor_server.db_pool = pool = FakePool(bulk_errors=[asyncpg.ConnectionDoesNotExistError("connection lost")])
+    rows = sample_rows(3)
+    asyncio.run(sensor_server._insert_rows(rows))
+    assert pool.written == rows
+    assert pool.acquired == 2
+
+
+def test_insert_rows_drops_the_batch_after_write_attempts(sensor_server):
+    sensor_server.db_pool = pool = FakePool(bulk_errors=[OSError("connection reset")] * legacy_server.WRITE_ATTEMPTS)
+    asyncio.run(sensor_server._insert_rows(sample_rows(3)))
+    assert pool.written == []
+    assert pool.acquired == legacy_server.WRITE_ATTEMPTS